@@ -16,7 +16,7 @@ import uuid
 from strands import Agent
 from strands.models.bedrock import BedrockModel
 
-from age_calculator.config import settings
+from age_calculator import config
 from age_calculator.tools import calculate_days_between, get_current_date
 
 logger: logging.Logger = logging.getLogger(__name__)
@@ -56,9 +56,9 @@ def create_agent() -> Agent:
     Returns:
         A fully initialised ``strands.Agent`` ready to accept user input.
     """
-    _masked_arn = re.sub(r":\d{12}:", ":****:", settings.model_arn)
+    _masked_arn = re.sub(r":\d{12}:", ":****:", config.settings.model_arn)
     logger.debug("Creating BedrockModel with model_id=%s", _masked_arn)
-    model = BedrockModel(model_id=settings.model_arn)
+    model = BedrockModel(model_id=config.settings.model_arn)
 
     agent = Agent(
         model=model,
@@ -70,6 +70,55 @@ def create_agent() -> Agent:
     return agent
 
 
+def _build_audit_record(
+    session_id: str,
+    user_id: str,
+    status: str,
+    latency_ms: float,
+    result: object = None,
+) -> dict[str, object]:
+    """Assemble the SR 11-7 audit record emitted after each agent invocation.
+
+    Args:
+        session_id: Session identifier for the invocation.
+        user_id: Identifier of the user making the request.
+        status: ``"success"`` or ``"error"``.
+        latency_ms: Wall-clock invocation latency in milliseconds.
+        result: The agent's response object, if the invocation succeeded.
+            The first tool-use content block (if any) is extracted into the
+            ``tool_name`` / ``tool_input`` fields.
+
+    Returns:
+        The audit record as a plain dict, ready for ``json.dumps``.
+    """
+    masked_arn = re.sub(r":\d{12}:", ":****:", config.settings.model_arn)
+
+    # Extract tool_name and tool_input from the first tool-use content block
+    # in the response message, if any.  The Strands response message is a dict
+    # with a "content" list; each element may carry a "type" of "tool_use".
+    tool_name: str | None = None
+    tool_input: object = None
+    if result is not None:
+        message = getattr(result, "message", None)
+        if isinstance(message, dict):
+            for block in message.get("content", []):
+                if isinstance(block, dict) and block.get("type") == "tool_use":
+                    tool_name = block.get("name")
+                    tool_input = block.get("input")
+                    break
+
+    return {
+        "session_id": session_id,
+        "user_id": user_id,
+        "model_id": masked_arn,
+        "timestamp": datetime.datetime.now(datetime.UTC).isoformat(),
+        "response_latency_ms": latency_ms,
+        "status": status,
+        "tool_name": tool_name,
+        "tool_input": tool_input,
+    }
+
+
 def invoke_with_audit(
     agent: Agent,
     user_input: str,
@@ -91,7 +140,6 @@ def invoke_with_audit(
     """
     sid = session_id or str(uuid.uuid4())
     uid = user_id or "system"
-    _masked_arn = re.sub(r":\d{12}:", ":****:", settings.model_arn)
     start = time.monotonic()
     status = "success"
     result = None
@@ -103,32 +151,14 @@ def invoke_with_audit(
         raise
     finally:
         latency_ms = round((time.monotonic() - start) * 1000, 2)
-
-        # Extract tool_name and tool_input from the first tool-use content block
-        # in the response message, if any.  The Strands response message is a dict
-        # with a "content" list; each element may carry a "type" of "tool_use".
-        tool_name: str | None = None
-        tool_input: object = None
-        if result is not None:
-            message = getattr(result, "message", None)
-            if isinstance(message, dict):
-                for block in message.get("content", []):
-                    if isinstance(block, dict) and block.get("type") == "tool_use":
-                        tool_name = block.get("name")
-                        tool_input = block.get("input")
-                        break
-
         audit_logger.info(
             json.dumps(
-                {
-                    "session_id": sid,
-                    "user_id": uid,
-                    "model_id": _masked_arn,
-                    "timestamp": datetime.datetime.now(datetime.UTC).isoformat(),
-                    "response_latency_ms": latency_ms,
-                    "status": status,
-                    "tool_name": tool_name,
-                    "tool_input": tool_input,
-                }
+                _build_audit_record(
+                    session_id=sid,
+                    user_id=uid,
+                    status=status,
+                    latency_ms=latency_ms,
+                    result=result,
+                )
             )
         )
@@ -5,11 +5,15 @@ Settings are loaded in priority order:
   2. .env file in the project root
   3. Validation error if a required variable is missing
 
+The module-level ``settings`` singleton is built lazily (PEP 562): importing
+this module costs nothing, and env parsing plus validation happen on the
+first attribute access.
+
 Usage::
 
-    from age_calculator.config import settings
+    from age_calculator import config
 
-    print(settings.model_arn)
+    print(config.settings.model_arn)
 """
 
 from pydantic import Field
@@ -21,6 +25,10 @@ class Settings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=False,
+        # Reject undeclared fields at validation time instead of growing the
+        # instance dict, and freeze instances — settings are read-only.
+        extra="forbid",
+        frozen=True,
     )
 
     model_arn: str = Field(
@@ -30,4 +38,18 @@ class Settings(BaseSettings):
     )
 
 
-settings = Settings()  # type: ignore[call-arg]
+_settings: Settings | None = None
+
+
+def __getattr__(name: str) -> Settings:
+    """Build the ``settings`` singleton on first access (PEP 562).
+
+    Annotated ``-> Settings`` so mypy types ``config.settings`` correctly:
+    every other name raises AttributeError below.
+    """
+    if name == "settings":
+        global _settings
+        if _settings is None:
+            _settings = Settings()  # type: ignore[call-arg]
+        return _settings
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -14,37 +14,69 @@ import os
 import re
 import sys
 
+from strands import Agent
+
 from age_calculator import create_agent
 from age_calculator.agent import invoke_with_audit
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# SEC-003 allowlist pattern, compiled once at import so run() does not pay a
+# regex-cache probe on every invocation.
+_ISO_DATE_RE: re.Pattern[str] = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+class _JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        payload: dict[str, object] = {
+            "timestamp": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        # Merge any extra fields passed via logger.info(..., extra={...})
+        for key, value in record.__dict__.items():
+            if key not in logging.LogRecord.__dict__ and not key.startswith("_"):
+                payload[key] = value
+        return json.dumps(payload)
+
+
+# Stateless, so one instance can serve every handler.
+_JSON_FORMATTER: _JsonFormatter = _JsonFormatter()
+
+# The LOG_FORMAT value last applied by _configure_logging, or None if logging
+# has not been configured yet.
+_last_log_format: str | None = None
+
+
+def _reset_logging_cache() -> None:
+    """Forget the last applied LOG_FORMAT so the next _configure_logging runs.
+
+    Intended for tests that exercise both configuration branches.
+    """
+    global _last_log_format
+    _last_log_format = None
+
 
 def _configure_logging() -> None:
     """Configure logging format based on the LOG_FORMAT environment variable.
 
     Set LOG_FORMAT=json for structured JSON output (CloudWatch-friendly).
     Any other value (or absent) falls back to human-readable plaintext.
+
+    ``logging.basicConfig(force=True)`` tears down and reinstalls the root
+    handlers under the logging lock, so repeat calls with an unchanged
+    LOG_FORMAT short-circuit instead of reconfiguring.
     """
+    global _last_log_format
     log_format = os.environ.get("LOG_FORMAT", "text").lower()
+    if log_format == _last_log_format:
+        return
+    _last_log_format = log_format
 
     if log_format == "json":
-        class _JsonFormatter(logging.Formatter):
-            def format(self, record: logging.LogRecord) -> str:
-                payload: dict[str, object] = {
-                    "timestamp": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
-                    "level": record.levelname,
-                    "logger": record.name,
-                    "message": record.getMessage(),
-                }
-                # Merge any extra fields passed via logger.info(..., extra={...})
-                for key, value in record.__dict__.items():
-                    if key not in logging.LogRecord.__dict__ and not key.startswith("_"):
-                        payload[key] = value
-                return json.dumps(payload)
-
         handler = logging.StreamHandler()
-        handler.setFormatter(_JsonFormatter())
+        handler.setFormatter(_JSON_FORMATTER)
         logging.basicConfig(level=logging.INFO, handlers=[handler], force=True)
     else:
         logging.basicConfig(
@@ -53,27 +85,19 @@ def _configure_logging() -> None:
         )
 
 
-def run() -> None:
-    """Configure logging, build the agent, and run the interactive prompt.
-
-    Validates the user-supplied birthdate with ``datetime.date.fromisoformat``
-    before passing it to the agent.  Exits with code 1 on invalid input so
-    that callers (shell scripts, Docker health checks, etc.) can detect
-    failure cleanly.
-
-    After a successful agent invocation a structured audit record is emitted
-    via ``logger.info`` containing session_id, timestamp (ISO UTC),
-    elapsed_ms, and the user input truncated to 100 characters.  The agent
-    response is intentionally excluded from the audit log to avoid retaining
-    PII.
-    """
-    _configure_logging()
+def _read_input() -> str:
+    """Greet the user and read the birthdate string from stdin."""
+    print("Welcome to the Age Calculator!")
+    return input("Please enter your birthdate (YYYY-MM-DD, e.g. 1990-05-15): ").strip()
 
-    agent = create_agent()
 
-    print("Welcome to the Age Calculator!")
-    birthdate_raw = input("Please enter your birthdate (YYYY-MM-DD, e.g. 1990-05-15): ").strip()
+def _process(agent: Agent, birthdate_raw: str) -> None:
+    """Validate the birthdate and invoke the agent with the standard prompt.
 
+    Validates with ``datetime.date.fromisoformat`` and exits with code 1 on
+    invalid input so that callers (shell scripts, Docker health checks, etc.)
+    can detect failure cleanly.
+    """
     try:
         datetime.date.fromisoformat(birthdate_raw)
     except ValueError:
@@ -90,7 +114,7 @@ def run() -> None:
     # surrounding whitespace and reject anything that does not match exactly
     # YYYY-MM-DD so that no extraneous characters can reach the agent prompt.
     birthdate_sanitised = birthdate_raw.strip()
-    if not re.fullmatch(r"\d{4}-\d{2}-\d{2}", birthdate_sanitised):
+    if not _ISO_DATE_RE.fullmatch(birthdate_sanitised):
         print(
             "Error: birthdate must be in the format YYYY-MM-DD (e.g. 1990-05-15)."
         )
@@ -99,5 +123,21 @@ def run() -> None:
     invoke_with_audit(agent, f"My birthdate is {birthdate_sanitised}. How many days old am I?")
 
 
+def run() -> None:
+    """Configure logging, build the agent, and run the interactive prompt.
+
+    After a successful agent invocation a structured audit record is emitted
+    via ``logger.info`` containing session_id, timestamp (ISO UTC),
+    elapsed_ms, and the user input truncated to 100 characters.  The agent
+    response is intentionally excluded from the audit log to avoid retaining
+    PII.
+    """
+    _configure_logging()
+
+    agent = create_agent()
+
+    _process(agent, _read_input())
+
+
 if __name__ == "__main__":
     run()
@@ -14,18 +14,47 @@ import pytest
 
 # ---------------------------------------------------------------------------
 # Ensure MODEL_ARN is set before any test module is collected.
-# The module-level ``settings = Settings()`` call in config.py runs at
-# collection time; without this sentinel value pydantic-settings raises a
-# ValidationError and the entire collection fails.
+# The ``settings`` singleton in config.py is built lazily, but the first
+# test (or fixture) that touches ``config.settings`` would fail with a
+# pydantic-settings ValidationError without this sentinel value.
 # ---------------------------------------------------------------------------
 os.environ.setdefault("MODEL_ARN", "arn:aws:bedrock:us-east-1::foundation-model/test-model")
 
 
 # ---------------------------------------------------------------------------
-# Model fixtures
+# BedrockModel instantiation counter
+# ---------------------------------------------------------------------------
+# Installed at conftest import time — before pytest collects any test module
+# that imports age_calculator.agent — so every real BedrockModel construction
+# in this process is recorded, including any that would happen at import time.
+# No test should ever trigger one: the suite always patches BedrockModel out.
 # ---------------------------------------------------------------------------
 
+from strands.models.bedrock import BedrockModel as _BedrockModel  # noqa: E402
+
+_bedrock_init_calls: list = []
+_original_bedrock_init = _BedrockModel.__init__
+
+
+def _counting_bedrock_init(self, *args, **kwargs):
+    _bedrock_init_calls.append((args, kwargs))
+    return _original_bedrock_init(self, *args, **kwargs)
+
+
+_BedrockModel.__init__ = _counting_bedrock_init
+
+
 @pytest.fixture
+def bedrock_init_calls() -> list:
+    """Log of real ``BedrockModel.__init__`` calls since process start."""
+    return _bedrock_init_calls
+
+
+# ---------------------------------------------------------------------------
+# Model fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(scope="module")
 def mock_bedrock_model() -> MagicMock:
     """A MagicMock standing in for ``BedrockModel`` — no AWS credentials needed.
 
@@ -45,17 +74,74 @@ def mock_bedrock_model() -> MagicMock:
 # Agent fixtures
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(scope="module")
+def _agent_module(mock_bedrock_model: MagicMock):
+    """One ``strands.Agent`` instance shared by all tests in a module.
+
+    Agent construction (tool registry, system prompt wiring) is the most
+    expensive setup in the suite, and the agent holds no per-test state other
+    than ``messages`` — so build it once per module and let ``agent_runner``
+    hand out a reset view per test.
+    """
+    with patch("age_calculator.agent.BedrockModel", return_value=mock_bedrock_model):
+        from age_calculator import create_agent
+        return create_agent()
+
+
+@pytest.fixture(scope="module")
+def tool_name_set(_agent_module) -> frozenset:
+    """Frozen set of the shared agent's tool names for O(1) membership checks."""
+    return frozenset(_agent_module.tool_names)
+
+
 @pytest.fixture
-def agent_runner(mock_bedrock_model: MagicMock):
+def agent_runner(_agent_module):
     """Fully constructed ``strands.Agent`` with ``BedrockModel`` patched out.
 
     Use this fixture in integration tests and evaluation tests to obtain a
     real agent whose tool registry, system prompt, and message list are live,
-    but whose underlying model never makes a Bedrock API call.
+    but whose underlying model never makes a Bedrock API call.  The instance
+    is shared per module; ``messages`` is cleared before each test.
     """
-    with patch("age_calculator.agent.BedrockModel", return_value=mock_bedrock_model):
-        from age_calculator import create_agent
-        return create_agent()
+    _agent_module.messages.clear()
+    return _agent_module
+
+
+# ---------------------------------------------------------------------------
+# Prompt fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(scope="session")
+def prompt_lower() -> str:
+    """``SYSTEM_PROMPT`` lowercased once per session for substring checks."""
+    from age_calculator.agent import SYSTEM_PROMPT
+    return SYSTEM_PROMPT.lower()
+
+
+# ---------------------------------------------------------------------------
+# Configuration fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def configured_arn(request, monkeypatch):
+    """Inject a Settings instance carrying ``request.param`` as the model ARN.
+
+    Use with ``@pytest.mark.parametrize("configured_arn", [...], indirect=True)``
+    so that ARN-sensitive tests share a single setup path instead of each
+    repeating the env-var + settings-rebind dance.  monkeypatch restores the
+    original settings object on teardown.
+
+    Tests that use this fixture mutate module-level config state, so they are
+    marked ``xdist_group(name="config_state")`` to keep them on one worker
+    when the suite runs under pytest-xdist.
+    """
+    import age_calculator.config as cfg_module
+    # Setting the attribute shadows the module's lazy __getattr__; monkeypatch
+    # removes the shadow on teardown so the lazy singleton takes over again.
+    monkeypatch.setattr(
+        cfg_module, "settings", cfg_module.Settings(MODEL_ARN=request.param), raising=False
+    )
+    yield request.param
 
 
 # ---------------------------------------------------------------------------
@@ -1,19 +1,20 @@
 """Unit tests for age_calculator.config.Settings."""
 
-import importlib
-
 import pytest
 from pydantic import ValidationError
 
+from age_calculator.config import Settings
+
 
 @pytest.mark.unit
+@pytest.mark.xdist_group(name="config_state")
 class TestSettings:
     def test_loads_model_arn_from_env(self, monkeypatch):
-        monkeypatch.setenv("MODEL_ARN", "arn:aws:bedrock:us-east-1::foundation-model/my-model")
-        import age_calculator.config as cfg_module
-        importlib.reload(cfg_module)
+        # Settings() re-reads the environment on every instantiation — no
+        # module reload (and no Pydantic schema rebuild) is needed.
         expected_arn = "arn:aws:bedrock:us-east-1::foundation-model/my-model"
-        assert cfg_module.Settings().model_arn == expected_arn
+        monkeypatch.setenv("MODEL_ARN", expected_arn)
+        assert Settings().model_arn == expected_arn
 
     def test_raises_when_model_arn_absent(self, monkeypatch):
         monkeypatch.delenv("MODEL_ARN", raising=False)
@@ -31,47 +32,33 @@ class TestSettings:
     def test_model_arn_attribute_matches_env(self, monkeypatch):
         expected = "arn:aws:bedrock:us-west-2::foundation-model/test"
         monkeypatch.setenv("MODEL_ARN", expected)
-        import age_calculator.config as cfg_module
-        importlib.reload(cfg_module)
-        assert cfg_module.Settings().model_arn == expected
+        assert Settings().model_arn == expected
 
     def test_case_insensitive_env_var(self, monkeypatch):
+        monkeypatch.delenv("MODEL_ARN", raising=False)
         monkeypatch.setenv("model_arn", "arn:aws:bedrock:eu-west-1::foundation-model/lower")
-        import age_calculator.config as cfg_module
-        importlib.reload(cfg_module)
-        s = cfg_module.Settings()
+        s = Settings()
         assert s.model_arn == "arn:aws:bedrock:eu-west-1::foundation-model/lower"
 
-    def test_settings_is_singleton_at_module_level(self, monkeypatch):
+    def test_settings_is_singleton_at_module_level(self):
         """The module-level ``settings`` object must be a Settings instance."""
-        monkeypatch.setenv("MODEL_ARN", "arn:aws:bedrock:us-east-1::foundation-model/singleton")
-        import age_calculator.config as cfg_module
-        importlib.reload(cfg_module)
-        from age_calculator.config import Settings
-        assert isinstance(cfg_module.settings, Settings)
+        from age_calculator.config import settings
+        assert isinstance(settings, Settings)
 
-    def test_settings_has_exactly_one_field(self, monkeypatch):
+    def test_settings_has_exactly_one_field(self):
         """Settings exposes only model_arn — no undocumented fields."""
-        monkeypatch.setenv("MODEL_ARN", "arn:aws:bedrock:us-east-1::foundation-model/test")
-        import age_calculator.config as cfg_module
-        importlib.reload(cfg_module)
-        fields = list(cfg_module.Settings.model_fields.keys())
+        fields = list(Settings.model_fields.keys())
         assert fields == ["model_arn"], (
             f"Settings has unexpected fields: {fields}. "
             "Only 'model_arn' should be declared."
         )
 
-    def test_settings_rejects_extra_fields(self, monkeypatch):
+    def test_settings_rejects_extra_fields(self):
         """Settings must not silently absorb undeclared fields (extra='forbid' behaviour)."""
-        monkeypatch.setenv("MODEL_ARN", "arn:aws:bedrock:us-east-1::foundation-model/test")
-        import age_calculator.config as cfg_module
-        importlib.reload(cfg_module)
-        from pydantic import ValidationError
         test_arn = "arn:aws:bedrock:us-east-1::foundation-model/test"
         with pytest.raises((ValidationError, TypeError)):
-            cfg_module.Settings(model_arn=test_arn, unexpected="bad")  # type: ignore[call-arg]
+            Settings(MODEL_ARN=test_arn, unexpected="bad")  # type: ignore[call-arg]
 
     def test_env_file_encoding_is_utf8(self):
         """model_config must specify UTF-8 so non-ASCII ARN characters are handled correctly."""
-        from age_calculator.config import Settings
         assert Settings.model_config["env_file_encoding"] == "utf-8"
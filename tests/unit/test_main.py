@@ -1,191 +1,204 @@
 """Unit tests for the main.py CLI entry point."""
 
-import json
+import copy
+import functools
+import io
 import logging
 import pathlib
-import runpy
-from unittest.mock import MagicMock, patch
+from unittest.mock import Mock, patch
 
 import pytest
 
+import main
+
 # Resolve main.py relative to this file's repo root (tests/ -> project root).
 _MAIN_PATH = str(pathlib.Path(__file__).parent.parent.parent / "main.py")
 
+# Template record for the JSON-formatter tests.  LogRecord.__init__ captures
+# thread and process identifiers on every call; build one record here and let
+# tests copy.copy it, overriding just the fields they assert on.
+_TEMPLATE_RECORD = logging.LogRecord(
+    name="test",
+    level=logging.INFO,
+    pathname="",
+    lineno=0,
+    msg="msg",
+    args=(),
+    exc_info=None,
+)
+
+
+@pytest.fixture(scope="session")
+def main_guard_code():
+    """``main.py`` compiled once per session for the ``__main__``-guard tests.
+
+    exec-ing the cached code object re-runs the module body with
+    ``__name__ == "__main__"`` (imports resolve from ``sys.modules``, so the
+    re-run is cheap) without runpy's per-call read and re-compile.
+    """
+    return compile(pathlib.Path(_MAIN_PATH).read_text(), _MAIN_PATH, "exec")
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def mock_agent():
-    return MagicMock()
+    # The agent double is only ever called and asserted on, so a plain Mock
+    # suffices — no MagicMock dunder machinery needed.
+    return Mock()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def patched_run(mock_agent):
-    """Patch create_agent so run() never hits AWS."""
+    """Patch create_agent so run() never hits AWS.
+
+    The patch context is entered once per module; the autouse reset fixture
+    below clears recorded calls between tests so per-test assertions
+    (assert_called_once, assert_not_called) still hold.
+    """
     with patch("main.create_agent", return_value=mock_agent):
         yield mock_agent
 
 
+@pytest.fixture(autouse=True)
+def _reset_mock_agent(mock_agent):
+    mock_agent.reset_mock()
+
+
+@pytest.fixture
+def set_input(monkeypatch):
+    """Return a setter that routes ``input()`` to a canned value.
+
+    ``monkeypatch.setattr`` swaps the builtin for a plain lambda — no
+    MagicMock construction per test — and restores it on teardown.
+    """
+    def _set(value: str) -> None:
+        monkeypatch.setattr("builtins.input", lambda _="": value)
+    return _set
+
+
+@pytest.fixture
+def stdout_buf(monkeypatch):
+    """Collect run()'s print output in an in-memory ``io.StringIO``.
+
+    For tests that only assert on a line or two of output, writing straight
+    into a StringIO is lighter than capsys' capture machinery.  ``print`` is
+    redirected rather than ``sys.stdout`` because pytest's capture rebinds
+    ``sys.stdout`` between the fixture-setup and call phases, which would
+    silently undo a fixture-time stdout swap.  Read the accumulated text
+    with ``stdout_buf.getvalue()``.
+    """
+    buf = io.StringIO()
+    monkeypatch.setattr("builtins.print", functools.partial(print, file=buf))
+    return buf
+
+
 @pytest.mark.unit
 class TestRunValidInput:
-    def test_valid_date_invokes_agent(self, patched_run):
-        with patch("builtins.input", return_value="1990-05-15"):
-            import main
-            main.run()
+    def test_valid_date_invokes_agent(self, patched_run, set_input):
+        """End-to-end: run() reads stdin, strips it, and invokes the agent."""
+        set_input("1990-05-15")
+        main.run()
         patched_run.assert_called_once()
 
     def test_invoke_with_audit_is_called(self, mock_agent):
-        """run() must route agent calls through invoke_with_audit, not directly."""
-        with patch("main.create_agent", return_value=mock_agent), \
-             patch("main.invoke_with_audit") as mock_invoke, \
-             patch("builtins.input", return_value="1990-05-15"):
-            import main
-            main.run()
+        """Agent calls must route through invoke_with_audit, not the agent directly."""
+        with patch("main.invoke_with_audit") as mock_invoke:
+            main._process(mock_agent, "1990-05-15")
         mock_invoke.assert_called_once()
         call_args = mock_invoke.call_args
         assert call_args[0][0] is mock_agent
 
-    def test_valid_date_passes_birthdate_in_prompt(self, patched_run):
-        with patch("builtins.input", return_value="2000-01-01"):
-            import main
-            main.run()
-        call_args = patched_run.call_args[0][0]
+    def test_valid_date_passes_birthdate_in_prompt(self, mock_agent):
+        main._process(mock_agent, "2000-01-01")
+        call_args = mock_agent.call_args[0][0]
         assert "2000-01-01" in call_args
 
-    def test_valid_date_does_not_exit(self, patched_run):
-        with patch("builtins.input", return_value="1985-12-31"):
-            import main
-            # Should not raise SystemExit
-            main.run()
+    def test_valid_date_does_not_exit(self, mock_agent):
+        # Should not raise SystemExit
+        main._process(mock_agent, "1985-12-31")
 
-    def test_strips_whitespace_from_input(self, patched_run):
-        with patch("builtins.input", return_value="  1990-05-15  "):
-            import main
-            main.run()
+    def test_strips_whitespace_from_input(self, patched_run, set_input):
+        set_input("  1990-05-15  ")
+        main.run()
         patched_run.assert_called_once()
 
 
 @pytest.mark.unit
 class TestRunInvalidInput:
-    def test_non_date_string_exits_with_code_1(self, patched_run):
-        with patch("builtins.input", return_value="not-a-date"):
-            with pytest.raises(SystemExit) as exc_info:
-                import main
-                main.run()
-        assert exc_info.value.code == 1
-
-    def test_partial_date_exits_with_code_1(self, patched_run):
-        with patch("builtins.input", return_value="1990-05"):
-            with pytest.raises(SystemExit) as exc_info:
-                import main
-                main.run()
-        assert exc_info.value.code == 1
-
-    def test_empty_string_exits_with_code_1(self, patched_run):
-        with patch("builtins.input", return_value=""):
-            with pytest.raises(SystemExit) as exc_info:
-                import main
-                main.run()
+    @pytest.mark.parametrize(
+        "bad_input",
+        ["not-a-date", "1990-05", ""],
+        ids=["non-date-string", "partial-date", "empty-string"],
+    )
+    def test_syntactically_invalid_input_exits_with_code_1(self, mock_agent, bad_input):
+        with pytest.raises(SystemExit) as exc_info:
+            main._process(mock_agent, bad_input)
         assert exc_info.value.code == 1
 
-    def test_invalid_date_prints_error_with_bad_input(self, patched_run, capsys):
+    def test_invalid_date_prints_error_with_bad_input(self, mock_agent, stdout_buf):
         bad = "garbage-input"
-        with patch("builtins.input", return_value=bad):
-            with pytest.raises(SystemExit):
-                import main
-                main.run()
-        captured = capsys.readouterr()
-        assert bad in captured.out
+        with pytest.raises(SystemExit):
+            main._process(mock_agent, bad)
+        assert bad in stdout_buf.getvalue()
 
-    def test_invalid_date_does_not_invoke_agent(self, patched_run):
-        with patch("builtins.input", return_value="not-a-date"):
-            with pytest.raises(SystemExit):
-                import main
-                main.run()
-        patched_run.assert_not_called()
+    def test_invalid_date_does_not_invoke_agent(self, mock_agent):
+        with pytest.raises(SystemExit):
+            main._process(mock_agent, "not-a-date")
+        mock_agent.assert_not_called()
 
 
 @pytest.mark.unit
 class TestRunOutputMessages:
     """Verify the exact text that run() prints so users receive clear guidance."""
 
-    def test_prints_welcome_message_on_valid_input(self, patched_run, capsys):
-        with patch("builtins.input", return_value="1990-05-15"):
-            import main
-            main.run()
-        captured = capsys.readouterr()
-        assert "Welcome" in captured.out
+    def test_prints_welcome_message_on_valid_input(self, patched_run, set_input, stdout_buf):
+        set_input("1990-05-15")
+        main.run()
+        assert "Welcome" in stdout_buf.getvalue()
 
-    def test_error_message_contains_format_hint(self, patched_run, capsys):
+    def test_error_message_contains_format_hint(self, mock_agent, stdout_buf):
         """Error message must contain 'YYYY-MM-DD' so the user knows the expected format."""
-        with patch("builtins.input", return_value="not-a-date"):
-            with pytest.raises(SystemExit):
-                import main
-                main.run()
-        captured = capsys.readouterr()
-        assert "YYYY-MM-DD" in captured.out
-
-    def test_error_message_contains_invalid_date_value(self, patched_run, capsys):
+        with pytest.raises(SystemExit):
+            main._process(mock_agent, "not-a-date")
+        assert "YYYY-MM-DD" in stdout_buf.getvalue()
+
+    def test_error_message_contains_invalid_date_value(self, mock_agent, stdout_buf):
         """Error message must echo the user's bad input so they can see what was wrong."""
         bad = "31/12/1990"
-        with patch("builtins.input", return_value=bad):
-            with pytest.raises(SystemExit):
-                import main
-                main.run()
-        captured = capsys.readouterr()
-        assert bad in captured.out
+        with pytest.raises(SystemExit):
+            main._process(mock_agent, bad)
+        assert bad in stdout_buf.getvalue()
 
 
 @pytest.mark.unit
 class TestRunInvalidCalendarDates:
     """Dates that are syntactically YYYY-MM-DD but calendar-invalid must also exit(1)."""
 
-    def test_non_leap_year_feb_29_exits_with_code_1(self, patched_run):
-        """2023-02-29 is not a real date — must be rejected at the CLI level."""
-        with patch("builtins.input", return_value="2023-02-29"):
-            with pytest.raises(SystemExit) as exc_info:
-                import main
-                main.run()
-        assert exc_info.value.code == 1
-
-    def test_non_leap_year_feb_29_does_not_invoke_agent(self, patched_run):
-        with patch("builtins.input", return_value="2023-02-29"):
-            with pytest.raises(SystemExit):
-                import main
-                main.run()
-        patched_run.assert_not_called()
-
-    def test_invalid_month_13_exits_with_code_1(self, patched_run):
-        with patch("builtins.input", return_value="2024-13-01"):
-            with pytest.raises(SystemExit) as exc_info:
-                import main
-                main.run()
-        assert exc_info.value.code == 1
-
-    def test_invalid_day_32_exits_with_code_1(self, patched_run):
-        with patch("builtins.input", return_value="2024-01-32"):
-            with pytest.raises(SystemExit) as exc_info:
-                import main
-                main.run()
+    @pytest.mark.parametrize(
+        "bad",
+        ["2023-02-29", "2024-13-01", "2024-01-32"],
+        ids=["non-leap-feb-29", "month-13", "day-32"],
+    )
+    def test_calendar_invalid_exits_with_code_1(self, mock_agent, bad):
+        with pytest.raises(SystemExit) as exc_info:
+            main._process(mock_agent, bad)
         assert exc_info.value.code == 1
+        mock_agent.assert_not_called()
 
 
 @pytest.mark.unit
 class TestRunPromptFormat:
     """The birthdate string passed to the agent must follow a predictable template."""
 
-    def test_agent_called_with_my_birthdate_is_prefix(self, patched_run):
-        """run() constructs the agent prompt as 'My birthdate is {date}...'."""
-        with patch("builtins.input", return_value="1990-05-15"):
-            import main
-            main.run()
-        call_args = patched_run.call_args[0][0]
+    def test_agent_called_with_my_birthdate_is_prefix(self, mock_agent):
+        """_process() constructs the agent prompt as 'My birthdate is {date}...'."""
+        main._process(mock_agent, "1990-05-15")
+        call_args = mock_agent.call_args[0][0]
         assert call_args.startswith("My birthdate is")
 
-    def test_agent_prompt_asks_how_many_days_old(self, patched_run):
+    def test_agent_prompt_asks_how_many_days_old(self, mock_agent):
         """The agent prompt must ask 'How many days old am I?' to trigger the tool chain."""
-        with patch("builtins.input", return_value="1990-05-15"):
-            import main
-            main.run()
-        call_args = patched_run.call_args[0][0]
+        main._process(mock_agent, "1990-05-15")
+        call_args = mock_agent.call_args[0][0]
         assert "days old" in call_args.lower()
 
 
@@ -193,17 +206,17 @@ class TestRunPromptFormat:
 class TestMainGuard:
     """The ``if __name__ == '__main__': run()`` guard must call run() when executed directly.
 
-    ``runpy.run_path`` executes the script file with ``__name__`` set to
-    ``'__main__'``, which is the only reliable way to cover the guard line
-    without actually spawning a subprocess.
+    exec-ing the session-cached code object with ``__name__`` set to
+    ``'__main__'`` covers the guard line without spawning a subprocess and
+    without runpy re-reading and re-compiling the script per test.
     """
 
-    def test_main_guard_calls_run_when_executed_as_script(self):
+    def test_main_guard_calls_run_when_executed_as_script(self, main_guard_code, set_input):
         """Simulate ``python main.py`` — the __main__ guard must invoke run()."""
-        mock_agent = MagicMock()
-        with patch("age_calculator.create_agent", return_value=mock_agent), \
-             patch("builtins.input", return_value="1990-05-15"):
-            runpy.run_path(_MAIN_PATH, run_name="__main__")
+        mock_agent = Mock()
+        set_input("1990-05-15")
+        with patch("age_calculator.create_agent", return_value=mock_agent):
+            exec(main_guard_code, {"__name__": "__main__"})
         mock_agent.assert_called_once()
 
 
@@ -211,26 +224,26 @@ class TestMainGuard:
 class TestConfigureLogging:
     """Tests for _configure_logging() covering both LOG_FORMAT branches."""
 
-    def test_plaintext_branch_uses_basicconfig(self):
+    @pytest.fixture(autouse=True)
+    def _fresh_logging_cache(self):
+        """Clear the LOG_FORMAT memo so each test exercises a real configure."""
+        main._reset_logging_cache()
+
+    def test_plaintext_branch_uses_basicconfig(self, monkeypatch):
         """Absent LOG_FORMAT installs the plaintext handler without error."""
-        import main
-        with patch.dict("os.environ", {}, clear=False):
-            # Remove LOG_FORMAT if present so the else-branch runs.
-            env_without = {k: v for k, v in __import__("os").environ.items() if k != "LOG_FORMAT"}
-            with patch.dict("os.environ", env_without, clear=True):
-                with patch("logging.basicConfig") as mock_basicconfig:
-                    main._configure_logging()
+        monkeypatch.delenv("LOG_FORMAT", raising=False)
+        with patch("logging.basicConfig") as mock_basicconfig:
+            main._configure_logging()
         mock_basicconfig.assert_called_once()
         call_kwargs = mock_basicconfig.call_args.kwargs
         assert call_kwargs.get("level") == logging.INFO
         assert "%(asctime)s" in call_kwargs.get("format", "")
 
-    def test_json_branch_installs_json_formatter(self):
+    def test_json_branch_installs_json_formatter(self, monkeypatch):
         """LOG_FORMAT=json installs a StreamHandler with a JSON formatter."""
-        import main
-        with patch.dict("os.environ", {"LOG_FORMAT": "json"}, clear=False):
-            with patch("logging.basicConfig") as mock_basicconfig:
-                main._configure_logging()
+        monkeypatch.setenv("LOG_FORMAT", "json")
+        with patch("logging.basicConfig") as mock_basicconfig:
+            main._configure_logging()
         mock_basicconfig.assert_called_once()
         call_kwargs = mock_basicconfig.call_args.kwargs
         assert call_kwargs.get("level") == logging.INFO
@@ -239,78 +252,73 @@ class TestConfigureLogging:
         assert len(handlers) == 1
         assert isinstance(handlers[0], logging.StreamHandler)
 
-    def test_json_formatter_produces_valid_json(self):
+    def test_json_formatter_produces_valid_json(self, monkeypatch):
         """The custom _JsonFormatter serialises a log record to valid JSON."""
-        import main
-        with patch.dict("os.environ", {"LOG_FORMAT": "json"}, clear=False):
-            # Capture the handler that gets registered so we can test the formatter.
-            captured_handlers: list = []
+        monkeypatch.setenv("LOG_FORMAT", "json")
+        # Capture the handler that gets registered so we can test the formatter.
+        captured_handlers: list = []
 
-            def capture_basicconfig(**kwargs):
-                captured_handlers.extend(kwargs.get("handlers", []))
+        def capture_basicconfig(**kwargs):
+            captured_handlers.extend(kwargs.get("handlers", []))
 
-            with patch("logging.basicConfig", side_effect=capture_basicconfig):
-                main._configure_logging()
+        with patch("logging.basicConfig", side_effect=capture_basicconfig):
+            main._configure_logging()
+
+        import orjson
 
         assert captured_handlers, "No handler was captured"
         formatter = captured_handlers[0].formatter
-        record = logging.LogRecord(
-            name="test.logger",
-            level=logging.INFO,
-            pathname="",
-            lineno=0,
-            msg="hello world",
-            args=(),
-            exc_info=None,
-        )
+        record = copy.copy(_TEMPLATE_RECORD)
+        record.name = "test.logger"
+        record.msg = "hello world"
         output = formatter.format(record)
-        parsed = json.loads(output)
+        parsed = orjson.loads(output)
         assert parsed["level"] == "INFO"
         assert parsed["logger"] == "test.logger"
         assert parsed["message"] == "hello world"
         assert "timestamp" in parsed
 
-    def test_json_formatter_includes_extra_fields(self):
+    def test_json_formatter_includes_extra_fields(self, monkeypatch):
         """Extra fields passed to logger.info are merged into the JSON payload."""
-        import main
-        with patch.dict("os.environ", {"LOG_FORMAT": "json"}, clear=False):
-            captured_handlers: list = []
+        monkeypatch.setenv("LOG_FORMAT", "json")
+        captured_handlers: list = []
+
+        def capture_basicconfig(**kwargs):
+            captured_handlers.extend(kwargs.get("handlers", []))
 
-            def capture_basicconfig(**kwargs):
-                captured_handlers.extend(kwargs.get("handlers", []))
+        with patch("logging.basicConfig", side_effect=capture_basicconfig):
+            main._configure_logging()
 
-            with patch("logging.basicConfig", side_effect=capture_basicconfig):
-                main._configure_logging()
+        import orjson
 
         formatter = captured_handlers[0].formatter
-        record = logging.LogRecord(
-            name="test",
-            level=logging.INFO,
-            pathname="",
-            lineno=0,
-            msg="audit",
-            args=(),
-            exc_info=None,
-        )
+        record = copy.copy(_TEMPLATE_RECORD)
+        record.msg = "audit"
         record.session_id = "abc-123"
         output = formatter.format(record)
-        parsed = json.loads(output)
+        parsed = orjson.loads(output)
         assert parsed.get("session_id") == "abc-123"
 
-    def test_json_branch_case_insensitive(self):
+    def test_repeat_call_with_same_format_is_memoized(self):
+        """A second call with an unchanged LOG_FORMAT must not reconfigure."""
+        with patch("logging.basicConfig") as mock_basicconfig:
+            main._configure_logging()
+            main._configure_logging()
+        mock_basicconfig.assert_called_once()
+
+    def test_json_branch_case_insensitive(self, monkeypatch):
         """LOG_FORMAT=JSON (uppercase) also activates the JSON branch."""
-        import main
-        with patch.dict("os.environ", {"LOG_FORMAT": "JSON"}, clear=False):
-            with patch("logging.basicConfig") as mock_basicconfig:
-                main._configure_logging()
+        monkeypatch.setenv("LOG_FORMAT", "JSON")
+        with patch("logging.basicConfig") as mock_basicconfig:
+            main._configure_logging()
         call_kwargs = mock_basicconfig.call_args.kwargs
         assert call_kwargs.get("force") is True
 
-    def test_main_guard_calls_run(self):
+    def test_main_guard_calls_run(self, main_guard_code, set_input):
         """The if __name__ == '__main__' guard invokes run() without error."""
-        mock_agent = MagicMock()
+        mock_agent = Mock()
+        set_input("1990-01-01")
         with patch("age_calculator.create_agent", return_value=mock_agent):
-            with patch("builtins.input", return_value="1990-01-01"):
-                # run_module re-executes the source; run() must complete cleanly.
-                runpy.run_module("main", run_name="__main__", alter_sys=False)
+            # exec re-runs the module body; run() must complete cleanly.
+            exec(main_guard_code, {"__name__": "__main__"})
         mock_agent.assert_called_once()
@@ -0,0 +1,26 @@
+"""Shared fixtures for the tool unit tests."""
+
+from types import MappingProxyType
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def tool_schema():
+    """Read-only views of each tool's input schema, built once per session.
+
+    Both tool-test modules assert against ``tool_spec["inputSchema"]["json"]``;
+    resolving the attribute chain here saves the per-test dict walks, and
+    ``MappingProxyType`` guards the shared dicts against accidental mutation
+    that would silently leak into every later schema assertion.
+    """
+    from age_calculator.tools import calculate_days_between, get_current_date
+
+    return {
+        "calculate_days_between": MappingProxyType(
+            calculate_days_between.tool_spec["inputSchema"]["json"]
+        ),
+        "get_current_date": MappingProxyType(
+            get_current_date.tool_spec["inputSchema"]["json"]
+        ),
+    }